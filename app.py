@@ -1,26 +1,108 @@
 import sys
 import os
+import time
 import multiprocessing
+# Only widgets needed for the main window are imported eagerly; PyQt6's
+# binding resolution is expensive, so dialog-only widgets are imported
+# lazily inside the functions that use them.
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
-    QPushButton, QTextEdit, QLabel, QInputDialog, QDialog,
-    QComboBox, QLineEdit, QDialogButtonBox, QMessageBox, QGroupBox,
-)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QAction, QKeySequence
-from transcriber import (
-    Recorder, transcribe_audio, get_data_dir, clear_cached_model,
-    check_api_available,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QTextEdit, QLabel, QDialog,
 )
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from settings import (
-    Settings, MODEL_SIZES, DEVICES, COMPUTE_TYPES, LANGUAGES, TOOLTIPS,
-    is_model_downloaded, get_model_size_gb,
+    Settings, MODEL_SIZES, DEVICES, COMPUTE_TYPES, LANGUAGES, LANGUAGE_INDEX,
+    TOOLTIPS, is_model_downloaded, get_model_size_gb,
 )
 
 
+# Single app-wide stylesheet. Widgets change looks by swapping a dynamic
+# property and re-polishing, instead of reparsing a per-widget QSS block
+# on every state change (expensive in Qt's style engine).
+APP_QSS = """
+QPushButton#recordBtn {
+    font-size: 18px; font-weight: bold; border-radius: 8px;
+    color: white; border: none;
+}
+QPushButton#recordBtn[state="idle"] { background-color: #4CAF50; }
+QPushButton#recordBtn[state="idle"]:hover { background-color: #45a049; }
+QPushButton#recordBtn[state="recording"] { background-color: #f44336; }
+QPushButton#recordBtn[state="recording"]:hover { background-color: #da190b; }
+QPushButton#recordBtn[state="busy"] { background-color: #999; }
+
+QPushButton#modeBtn {
+    font-size: 13px; font-weight: bold; border-radius: 15px; color: white;
+}
+QPushButton#modeBtn[mode="api"] { background-color: #2196F3; border: 2px solid #1565C0; }
+QPushButton#modeBtn[mode="api"]:hover { background-color: #1976D2; }
+QPushButton#modeBtn[mode="local"] { background-color: #607D8B; border: 2px solid #455A64; }
+QPushButton#modeBtn[mode="local"]:hover { background-color: #546E7A; }
+
+QLabel#statusLabel { font-size: 14px; padding: 4px; }
+QLabel#statusLabel[level="ready"] { color: #666; }
+QLabel#statusLabel[level="recording"] { color: #f44336; }
+QLabel#statusLabel[level="working"] { color: #ff9800; }
+QLabel#statusLabel[level="done"] { color: #4CAF50; }
+QLabel#statusLabel[level="error"] { color: #f44336; }
+
+QLabel#modeLabel { font-size: 10px; color: #999; margin: 0; padding: 0; }
+
+QLabel#fallbackWarning {
+    font-size: 9px; color: #f57c00; background-color: #fff3e0;
+    border-radius: 4px; padding: 2px 4px; margin: 0;
+}
+
+QTextEdit#textArea { font-size: 14px; padding: 8px; }
+
+QLabel#helpIcon { color: #888; font-size: 14px; }
+
+QPushButton#copyBtn {
+    font-size: 13px; border-radius: 6px;
+    background-color: #e0e0e0; color: #333; border: none;
+}
+QPushButton#copyBtn:hover { background-color: #bdbdbd; }
+"""
+
+# Cached API key — avoids an os.environ lookup on every recording
+_cached_api_key = None
+
+
+def get_api_key():
+    """Return the OpenAI API key, reading the environment once."""
+    global _cached_api_key
+    if _cached_api_key is None:
+        _cached_api_key = os.environ.get("OPENAI_API_KEY", "")
+    return _cached_api_key
+
+
+def set_api_key(key):
+    """Update (or clear) the API key in both the environment and the cache."""
+    global _cached_api_key
+    _cached_api_key = key
+    if key:
+        os.environ["OPENAI_API_KEY"] = key
+    elif "OPENAI_API_KEY" in os.environ:
+        del os.environ["OPENAI_API_KEY"]
+
+
+def _write_env_file(env_path, key):
+    """Atomically write the .env file holding the API key."""
+    tmp = env_path.with_suffix(".tmp")
+    tmp.write_text(f'OPENAI_API_KEY="{key}"\n')
+    os.replace(tmp, env_path)
+
+
+def _local_key_ok(key):
+    """Cheap offline sanity check on an OpenAI API key."""
+    return bool(key) and key.startswith("sk-") and len(key) >= 20
+
+
 def ensure_api_key():
     """Prompt for OpenAI API key on first launch if not set."""
-    if os.environ.get("OPENAI_API_KEY"):
+    from PyQt6.QtWidgets import QInputDialog
+    from transcriber import get_data_dir
+
+    if get_api_key():
         return True
     env_path = get_data_dir() / ".env"
     key, ok = QInputDialog.getText(
@@ -29,8 +111,11 @@ def ensure_api_key():
         "Leave blank to use local-only mode.",
     )
     if ok and key.strip():
-        env_path.write_text(f'OPENAI_API_KEY="{key.strip()}"\n')
-        os.environ["OPENAI_API_KEY"] = key.strip()
+        key = key.strip()
+        set_api_key(key)
+        # The env var above is what this session reads; defer the disk
+        # write until after the main window has painted
+        QTimer.singleShot(0, lambda: _write_env_file(env_path, key))
         return True
     return False
 
@@ -46,15 +131,18 @@ class SettingsDialog(QDialog):
         self.init_ui()
 
     def init_ui(self):
-        from PyQt6.QtWidgets import QCheckBox
+        from PyQt6.QtWidgets import (
+            QCheckBox, QComboBox, QLineEdit, QDialogButtonBox, QGroupBox,
+            QFormLayout,
+        )
 
         layout = QVBoxLayout()
 
         def make_help_label(tooltip):
             """Create a help icon with tooltip."""
             label = QLabel("ⓘ")
+            label.setObjectName("helpIcon")
             label.setToolTip(tooltip)
-            label.setStyleSheet("color: #888; font-size: 14px;")
             return label
 
         def make_row_with_help(widget, tooltip):
@@ -68,41 +156,54 @@ class SettingsDialog(QDialog):
         local_group = QGroupBox("Local Transcription")
         local_layout = QFormLayout()
 
-        # Model size
+        # Combos are populated with one addItems call each (one binding
+        # crossing instead of one per item), with signals blocked so no
+        # intermediate currentIndexChanged emissions fire
+
+        # Model size — display text carries the ✓, userData the clean size
         self.model_combo = QComboBox()
-        for size in MODEL_SIZES.keys():
-            downloaded = " ✓" if is_model_downloaded(size) else ""
-            self.model_combo.addItem(f"{size}{downloaded}", size)
+        self.model_combo.blockSignals(True)
+        self.model_combo.addItems([
+            f"{size}{' ✓' if is_model_downloaded(size) else ''}"
+            for size in MODEL_SIZES
+        ])
+        for i, size in enumerate(MODEL_SIZES):
+            self.model_combo.setItemData(i, size)
         self.model_combo.setCurrentIndex(
             list(MODEL_SIZES.keys()).index(self.settings.model_size)
         )
+        self.model_combo.blockSignals(False)
         local_layout.addRow("Model size:", make_row_with_help(
             self.model_combo, TOOLTIPS["model_size"]))
 
         # Device
         self.device_combo = QComboBox()
-        for device in DEVICES:
-            self.device_combo.addItem(device)
+        self.device_combo.blockSignals(True)
+        self.device_combo.addItems(DEVICES)
         self.device_combo.setCurrentText(self.settings.device)
+        self.device_combo.blockSignals(False)
         local_layout.addRow("Device:", make_row_with_help(
             self.device_combo, TOOLTIPS["device"]))
 
         # Compute type (renamed to Precision in UI)
         self.compute_combo = QComboBox()
-        for ct in COMPUTE_TYPES:
-            self.compute_combo.addItem(ct)
+        self.compute_combo.blockSignals(True)
+        self.compute_combo.addItems(COMPUTE_TYPES)
         self.compute_combo.setCurrentText(self.settings.compute_type)
+        self.compute_combo.blockSignals(False)
         local_layout.addRow("Precision:", make_row_with_help(
             self.compute_combo, TOOLTIPS["compute_type"]))
 
-        # Language
+        # Language — display names in one call, codes as userData
         self.language_combo = QComboBox()
-        for code, name in LANGUAGES:
-            self.language_combo.addItem(name, code)
+        self.language_combo.blockSignals(True)
+        self.language_combo.addItems([name for _, name in LANGUAGES])
         for i, (code, _) in enumerate(LANGUAGES):
-            if code == self.settings.language:
-                self.language_combo.setCurrentIndex(i)
-                break
+            self.language_combo.setItemData(i, code)
+        self.language_combo.setCurrentIndex(
+            LANGUAGE_INDEX.get(self.settings.language, 0)
+        )
+        self.language_combo.blockSignals(False)
         local_layout.addRow("Language:", make_row_with_help(
             self.language_combo, TOOLTIPS["language"]))
 
@@ -124,7 +225,7 @@ class SettingsDialog(QDialog):
         self.api_key_input = QLineEdit()
         self.api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.api_key_input.setPlaceholderText("Enter API key...")
-        current_key = os.environ.get("OPENAI_API_KEY", "")
+        current_key = get_api_key()
         if current_key:
             self.api_key_input.setText(current_key)
         api_layout.addRow("OpenAI API Key:", self.api_key_input)
@@ -159,14 +260,13 @@ class SettingsDialog(QDialog):
         )
         self.device_combo.setCurrentText("cpu")
         self.compute_combo.setCurrentText("int8")
-        for i, (code, _) in enumerate(LANGUAGES):
-            if code == "en":
-                self.language_combo.setCurrentIndex(i)
-                break
+        self.language_combo.setCurrentIndex(LANGUAGE_INDEX["en"])
         self.noise_filter_checkbox.setChecked(True)
 
     def save_settings(self):
         """Validate and save settings."""
+        from PyQt6.QtWidgets import QMessageBox
+
         new_model = self.model_combo.currentData()
 
         # Check if model needs to be downloaded
@@ -183,6 +283,9 @@ class SettingsDialog(QDialog):
                 )
                 if reply != QMessageBox.StandardButton.Yes:
                     return
+                # The model will be downloaded on first use; drop the
+                # memoized "not downloaded" result so the ✓ shows next open
+                is_model_downloaded.cache_clear()
 
         # Check if local settings changed (need to clear cached model)
         old_settings = (
@@ -190,86 +293,142 @@ class SettingsDialog(QDialog):
             self.settings.device,
             self.settings.compute_type,
         )
+        # currentData holds the clean size string (addItem stores it as
+        # userData); strip() guards against any display-text decoration
+        # leaking into the comparison and forcing a spurious model reload
         new_settings = (
             new_model,
-            self.device_combo.currentText(),
-            self.compute_combo.currentText(),
+            self.device_combo.currentText().strip(),
+            self.compute_combo.currentText().strip(),
         )
         if old_settings != new_settings:
-            clear_cached_model()
+            from transcriber import clear_cached_model, is_model_cached
+            # Only drop the cached model if one was actually loaded
+            if is_model_cached():
+                clear_cached_model()
 
         # Save settings
         self.settings.model_size = new_model
-        self.settings.device = self.device_combo.currentText()
-        self.settings.compute_type = self.compute_combo.currentText()
+        self.settings.device = new_settings[1]
+        self.settings.compute_type = new_settings[2]
         self.settings.language = self.language_combo.currentData()
         self.settings.filter_background_noise = self.noise_filter_checkbox.isChecked()
         self.settings.save()
 
-        # Update API key if changed
+        # Update API key if changed; compare stripped values so a
+        # whitespace-only difference doesn't trigger a rewrite
         new_key = self.api_key_input.text().strip()
-        current_key = os.environ.get("OPENAI_API_KEY", "")
+        current_key = get_api_key().strip()
         if new_key != current_key:
+            from transcriber import get_data_dir
             env_path = get_data_dir() / ".env"
+            set_api_key(new_key)
+            # Defer the .env write/delete so closing the dialog stays snappy
             if new_key:
-                env_path.write_text(f'OPENAI_API_KEY="{new_key}"\n')
-                os.environ["OPENAI_API_KEY"] = new_key
+                QTimer.singleShot(0, lambda: _write_env_file(env_path, new_key))
             else:
                 # Clear the key
-                if env_path.exists():
-                    env_path.unlink()
-                if "OPENAI_API_KEY" in os.environ:
-                    del os.environ["OPENAI_API_KEY"]
+                QTimer.singleShot(0, lambda: env_path.unlink(missing_ok=True))
 
         self.accept()
 
 
-class TranscribeWorker(QThread):
-    """Background thread for transcription."""
+class ApiCheckSignals(QObject):
+    """Signals for ApiCheckJob."""
+    done = pyqtSignal(bool, object)  # available, reason
+
+
+class ApiCheckJob(QRunnable):
+    """Background API availability check (DNS/TCP), off the GUI thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = ApiCheckSignals()
+
+    def run(self):
+        from transcriber import check_api_available
+        ok, reason = check_api_available()
+        self.signals.done.emit(ok, reason)
+
+
+class TranscribeSignals(QObject):
+    """Signals for TranscribeJob (QRunnable can't define its own)."""
     # Signal: text, elapsed, used_api, api_price, fallback_reason
     finished = pyqtSignal(str, float, bool, object, object)
     error = pyqtSignal(str)
     status_update = pyqtSignal(str)
 
+
+class TranscribeJob(QRunnable):
+    """Transcription job run on the shared thread pool.
+
+    Using QThreadPool reuses OS threads instead of spawning a fresh
+    QThread per recording.
+    """
+
     def __init__(self, audio_path, force_local, settings: Settings):
         super().__init__()
         self.audio_path = audio_path
         self.force_local = force_local
         self.settings = settings
+        self.signals = TranscribeSignals()
 
     def run(self):
+        from transcriber import transcribe_audio
+
         try:
             text, elapsed, used_api, api_price, _, reason = transcribe_audio(
                 self.audio_path,
                 force_local=self.force_local,
-                status=lambda msg: self.status_update.emit(msg),
+                status=lambda msg: self.signals.status_update.emit(msg),
                 model_size=self.settings.model_size,
                 device=self.settings.device,
                 compute_type=self.settings.compute_type,
                 language=self.settings.language,
                 filter_background_noise=self.settings.filter_background_noise,
             )
-            self.finished.emit(text, elapsed, used_api, api_price, reason)
+            self.signals.finished.emit(text, elapsed, used_api, api_price, reason)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
         finally:
-            if os.path.exists(self.audio_path):
-                os.remove(self.audio_path)
+            try:
+                os.unlink(self.audio_path)
+            except FileNotFoundError:
+                pass
 
 
 class VTTApp(QWidget):
+    # How long an API availability result stays fresh
+    _API_CHECK_TTL = 300.0  # seconds
+
+    # Hoisted so keyPressEvent doesn't rebuild these per keystroke
+    _ENTER_KEYS = frozenset({Qt.Key.Key_Return, Qt.Key.Key_Enter})
+    _ESCAPE = Qt.Key.Key_Escape
+
     def __init__(self, settings: Settings):
         super().__init__()
         self.settings = settings
-        self.recorder = Recorder()
+        self._recorder = None  # Created lazily; transcriber pulls in heavy audio libs
         self.is_recording = False
         self.use_local = False
-        self.worker = None
+        self.thread_pool = QThreadPool.globalInstance()
+        self.job = None  # Keep a reference so signals stay connected
+        self._current_duration = 0.0  # Seconds of audio in the running job
         self.api_fallback_reason = None  # Tracks why API mode fell back to local
         self.fallback_warning_shown = False  # Only show dialog once per session
+        self._api_check_cache = None  # (key, timestamp, ok, reason)
         self.init_ui()
         self.init_menu()
 
+    @property
+    def recorder(self):
+        """Recorder, created on first use so the window shows before
+        transcriber (and its audio/model dependencies) is imported."""
+        if self._recorder is None:
+            from transcriber import Recorder
+            self._recorder = Recorder()
+        return self._recorder
+
     def init_ui(self):
         self.setWindowTitle("Voice to Text")
         self.setMinimumSize(400, 500)
@@ -278,10 +437,11 @@ class VTTApp(QWidget):
 
         # Status label (selectable for copying error messages)
         self.status = QLabel("Ready (press Enter to record)")
+        self.status.setObjectName("statusLabel")
+        self.status.setProperty("level", "ready")
         self.status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.status.setWordWrap(True)
-        self.status.setStyleSheet("font-size: 14px; color: #666; padding: 4px;")
         layout.addWidget(self.status)
 
         # Button row
@@ -289,6 +449,8 @@ class VTTApp(QWidget):
 
         # Record button
         self.btn = QPushButton("Record")
+        self.btn.setObjectName("recordBtn")
+        self.btn.setProperty("state", "idle")
         self.btn.setFixedHeight(60)
         self.btn.clicked.connect(self.toggle_recording)
         btn_row.addWidget(self.btn)
@@ -298,20 +460,19 @@ class VTTApp(QWidget):
 
         # Warning label for forced local mode (hidden by default)
         self.fallback_warning = QLabel("")
+        self.fallback_warning.setObjectName("fallbackWarning")
         self.fallback_warning.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.fallback_warning.setWordWrap(True)
-        self.fallback_warning.setStyleSheet(
-            "font-size: 9px; color: #f57c00; background-color: #fff3e0; "
-            "border-radius: 4px; padding: 2px 4px; margin: 0;"
-        )
         self.fallback_warning.hide()
         mode_col.addWidget(self.fallback_warning)
 
         self.mode_label = QLabel("Mode")
+        self.mode_label.setObjectName("modeLabel")
         self.mode_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.mode_label.setStyleSheet("font-size: 10px; color: #999; margin: 0; padding: 0;")
         mode_col.addWidget(self.mode_label)
         self.mode_btn = QPushButton("API")
+        self.mode_btn.setObjectName("modeBtn")
+        self.mode_btn.setProperty("mode", "api")
         self.mode_btn.setCheckable(True)
         self.mode_btn.setFixedHeight(40)
         self.mode_btn.setFixedWidth(100)
@@ -324,21 +485,15 @@ class VTTApp(QWidget):
 
         # Text area
         self.text_area = QTextEdit()
+        self.text_area.setObjectName("textArea")
         self.text_area.setPlaceholderText("Transcriptions will appear here...")
-        self.text_area.setStyleSheet("font-size: 14px; padding: 8px;")
         layout.addWidget(self.text_area)
 
         # Copy button
         self.copy_btn = QPushButton("Copy All")
+        self.copy_btn.setObjectName("copyBtn")
         self.copy_btn.setFixedHeight(36)
         self.copy_btn.clicked.connect(self.copy_text)
-        self.copy_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 13px; border-radius: 6px;
-                background-color: #e0e0e0; color: #333; border: none;
-            }
-            QPushButton:hover { background-color: #bdbdbd; }
-        """)
         layout.addWidget(self.copy_btn)
 
         self.setLayout(layout)
@@ -349,6 +504,7 @@ class VTTApp(QWidget):
     def init_menu(self):
         """Set up the macOS menu bar."""
         from PyQt6.QtWidgets import QMenuBar
+        from PyQt6.QtGui import QAction, QKeySequence
 
         menubar = QMenuBar(self)
         menubar.setNativeMenuBar(True)
@@ -380,25 +536,44 @@ class VTTApp(QWidget):
         super().mousePressEvent(event)
 
     def keyPressEvent(self, event):
-        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+        key = event.key()
+        if key in self._ENTER_KEYS:
             if not self.text_area.hasFocus():
                 self.toggle_recording()
                 return
-        if event.key() == Qt.Key.Key_Escape:
+        if key == self._ESCAPE:
             self.text_area.clearFocus()
             self.setFocus()
             return
         super().keyPressEvent(event)
 
+    def _repolish(self, widget, prop, value):
+        """Swap a dynamic property and re-polish so APP_QSS re-applies.
+
+        Skips the unpolish/polish cycle when the property is unchanged,
+        so rapid same-level status updates (several per transcription)
+        cost only a setText.
+        """
+        if widget.property(prop) != value:
+            widget.setProperty(prop, value)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def set_status(self, text, level):
+        """Update the status label text and its color level."""
+        self.status.setText(text)
+        self._repolish(self.status, "level", level)
+
     def copy_text(self):
         text = self.text_area.toPlainText()
         if text:
             QApplication.clipboard().setText(text)
-            self.status.setText("Copied to clipboard")
-            self.status.setStyleSheet("font-size: 14px; color: #4CAF50; padding: 4px;")
+            self.set_status("Copied to clipboard", "done")
 
     def toggle_mode(self):
         self.use_local = not self.use_local
+        # A manual mode switch invalidates the memoized availability result
+        self._api_check_cache = None
         # Clear fallback warning when user manually switches modes
         if self.use_local:
             self.fallback_warning.hide()
@@ -414,82 +589,103 @@ class VTTApp(QWidget):
     def start_recording(self):
         self.is_recording = True
         self.recorder.start()
+        # Warm the local model while the mic is rolling — that time is
+        # otherwise idle, and a cold load would serialize after Stop
+        if self.use_local:
+            from transcriber import prewarm_model
+            prewarm_model(self.settings.model_size, self.settings.device,
+                          self.settings.compute_type)
         self.btn.setText("Stop")
-        self.btn.setStyleSheet("""
-            QPushButton {
-                font-size: 18px; font-weight: bold; border-radius: 8px;
-                background-color: #f44336; color: white; border: none;
-            }
-            QPushButton:hover { background-color: #da190b; }
-        """)
+        self._repolish(self.btn, "state", "recording")
         self.mode_btn.setEnabled(False)
-        self.status.setText("Recording... (press Enter to stop)")
-        self.status.setStyleSheet("font-size: 14px; color: #f44336; padding: 4px;")
+        self.set_status("Recording... (press Enter to stop)", "recording")
 
     def stop_recording(self):
         self.is_recording = False
         duration = self.recorder.stop()
         self.btn.setText("Record")
         self.btn.setEnabled(False)
-        self.btn.setStyleSheet("""
-            QPushButton {
-                font-size: 18px; font-weight: bold; border-radius: 8px;
-                background-color: #999; color: white; border: none;
-            }
-        """)
-
-        # Check if API mode will fall back to local
+        self._repolish(self.btn, "state", "busy")
+
+        # Check if API mode will fall back to local. Only a cheap local
+        # key-format check runs here; the network check goes to the thread
+        # pool so stopping a recording never blocks on DNS/TCP.
+        force_local = self.use_local
         if not self.use_local:
-            api_available, reason = check_api_available()
-            if not api_available and reason:
-                self.api_fallback_reason = reason
-                self.fallback_warning.setText(f"Using local: {reason}")
-                self.fallback_warning.show()
-
-                # Show dialog once per session
-                if not self.fallback_warning_shown:
-                    self.fallback_warning_shown = True
-                    QMessageBox.warning(
-                        self,
-                        "Using Local Mode",
-                        f"API mode is unavailable:\n\n{reason}\n\n"
-                        "Transcription will use the local model instead.",
-                        QMessageBox.StandardButton.Ok,
-                    )
-
-        mode = "local" if self.use_local else "API"
-        self.status.setText(f"Transcribing via {mode} ({duration:.1f}s of audio)...")
-        self.status.setStyleSheet("font-size: 14px; color: #ff9800; padding: 4px;")
+            if not _local_key_ok(get_api_key()):
+                self._show_api_fallback("No valid OPENAI_API_KEY set")
+                # The backend only checks that a key is set, not its
+                # format — force local so the job matches the warning
+                force_local = True
+            elif self._api_check_fresh():
+                # Reuse the memoized result instead of re-probing the network
+                _, _, ok, reason = self._api_check_cache
+                if not ok and reason:
+                    self._show_api_fallback(reason)
+            else:
+                check = ApiCheckJob()
+                check.signals.done.connect(self.on_api_check)
+                self._api_check_job = check  # Keep signals alive
+                self.thread_pool.start(check)
+
+        mode = "local" if force_local else "API"
+        self.set_status(f"Transcribing via {mode} ({duration:.1f}s of audio)...",
+                        "working")
 
         temp_path = self.recorder.save_to_temp()
-        self.worker = TranscribeWorker(temp_path, force_local=self.use_local,
-                                       settings=self.settings)
-        self.worker.status_update.connect(self.on_status_update)
-        self.worker.finished.connect(
-            lambda text, elapsed, used_api, api_price, reason: self.on_transcription(
-                text, elapsed, duration, used_api, api_price, reason,
+        self._current_duration = duration  # Read back in on_transcription
+        self.job = TranscribeJob(temp_path, force_local=force_local,
+                                 settings=self.settings)
+        self.job.signals.status_update.connect(self.on_status_update)
+        self.job.signals.finished.connect(self.on_transcription)
+        self.job.signals.error.connect(self.on_error)
+        self.thread_pool.start(self.job)
+
+    def _show_api_fallback(self, reason):
+        """Show the fallback warning label (and, once per session, a dialog)."""
+        self.api_fallback_reason = reason
+        self.fallback_warning.setText(f"Using local: {reason}")
+        self.fallback_warning.show()
+
+        if not self.fallback_warning_shown:
+            self.fallback_warning_shown = True
+            from PyQt6.QtWidgets import QMessageBox
+            QMessageBox.warning(
+                self,
+                "Using Local Mode",
+                f"API mode is unavailable:\n\n{reason}\n\n"
+                "Transcription will use the local model instead.",
+                QMessageBox.StandardButton.Ok,
             )
-        )
-        self.worker.error.connect(self.on_error)
-        self.worker.start()
+
+    def _api_check_fresh(self):
+        """True if the cached API availability result is still usable."""
+        if self._api_check_cache is None:
+            return False
+        key, ts, _, _ = self._api_check_cache
+        return key == get_api_key() and time.monotonic() - ts < self._API_CHECK_TTL
+
+    def on_api_check(self, ok, reason):
+        """Handle the async API availability result and memoize it."""
+        self._api_check_cache = (get_api_key(), time.monotonic(), ok, reason)
+        if not ok and reason:
+            self._show_api_fallback(reason)
 
     def on_status_update(self, msg):
-        self.status.setText(msg)
-        self.status.setStyleSheet("font-size: 14px; color: #ff9800; padding: 4px;")
+        self.set_status(msg, "working")
 
-    def on_transcription(self, text, elapsed, recording_duration, used_api, api_price, reason):
+    def on_transcription(self, text, elapsed, used_api, api_price, reason):
         if self.text_area.toPlainText():
             self.text_area.append("")
         self.text_area.append(text.strip())
 
         info = f"Done in {elapsed:.1f}s"
         if used_api and api_price:
-            cost = (recording_duration / 60) * api_price
+            cost = (self._current_duration / 60) * api_price
             info += f" (API, ~${cost:.4f})"
         else:
             info += " (local)"
-        self.status.setText(info)
-        self.status.setStyleSheet("font-size: 14px; color: #4CAF50; padding: 4px;")
+        self.set_status(info, "done")
 
         # Update fallback warning based on result
         if not self.use_local and not used_api and reason and reason != "Local mode selected":
@@ -505,8 +701,7 @@ class VTTApp(QWidget):
         self.reset_button()
 
     def on_error(self, error_msg):
-        self.status.setText(f"Error: {error_msg}")
-        self.status.setStyleSheet("font-size: 14px; color: #f44336; padding: 4px;")
+        self.set_status(f"Error: {error_msg}", "error")
         self.reset_button()
 
     def reset_button(self):
@@ -516,37 +711,16 @@ class VTTApp(QWidget):
 
     def update_styles(self):
         self.btn.setText("Record")
-        self.btn.setStyleSheet("""
-            QPushButton {
-                font-size: 18px; font-weight: bold; border-radius: 8px;
-                background-color: #4CAF50; color: white; border: none;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        self._repolish(self.btn, "state", "idle")
         self.mode_btn.setChecked(self.use_local)
-        if self.use_local:
-            self.mode_btn.setText("Local")
-            self.mode_btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 13px; font-weight: bold; border-radius: 15px;
-                    background-color: #607D8B; color: white; border: 2px solid #455A64;
-                }
-                QPushButton:hover { background-color: #546E7A; }
-            """)
-        else:
-            self.mode_btn.setText("API")
-            self.mode_btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 13px; font-weight: bold; border-radius: 15px;
-                    background-color: #2196F3; color: white; border: 2px solid #1565C0;
-                }
-                QPushButton:hover { background-color: #1976D2; }
-            """)
+        self.mode_btn.setText("Local" if self.use_local else "API")
+        self._repolish(self.mode_btn, "mode", "local" if self.use_local else "api")
 
 
 def main():
     multiprocessing.freeze_support()
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_QSS)
     ensure_api_key()
     settings = Settings()
     window = VTTApp(settings)
@@ -1,10 +1,16 @@
 """Settings management for Voice to Text app."""
+import functools
 import json
+import os
 import sys
 from pathlib import Path
-from transcriber import get_data_dir
 
-SETTINGS_FILE = get_data_dir() / "settings.json"
+
+def _settings_file():
+    """Path to settings.json. Imports transcriber on demand so loading
+    this module doesn't pull in the audio stack."""
+    from transcriber import get_data_dir
+    return get_data_dir() / "settings.json"
 
 # Model sizes and their approximate download sizes in GB
 MODEL_SIZES = {
@@ -49,6 +55,9 @@ LANGUAGES = [
     ("hi", "Hindi"),
 ]
 
+# Code → combo index, so the UI can avoid scanning LANGUAGES
+LANGUAGE_INDEX = {code: i for i, (code, _) in enumerate(LANGUAGES)}
+
 DEFAULTS = {
     "model_size": "small",
     "device": "cpu",
@@ -64,77 +73,76 @@ class Settings:
     """Manages app settings with JSON persistence."""
 
     def __init__(self):
-        self.model_size = DEFAULTS["model_size"]
-        self.device = DEFAULTS["device"]
-        self.compute_type = DEFAULTS["compute_type"]
-        self.language = DEFAULTS["language"]
-        self.filter_background_noise = DEFAULTS["filter_background_noise"]
+        # Fields are driven by DEFAULTS so adding a setting means adding
+        # one dict entry, not editing five methods
+        for key, value in DEFAULTS.items():
+            setattr(self, key, value)
+        self._last_saved = None  # Last dict written to disk, to skip no-op saves
         self.load()
 
     def load(self):
         """Load settings from disk, using defaults for missing values."""
-        if SETTINGS_FILE.exists():
-            try:
-                data = json.loads(SETTINGS_FILE.read_text())
-                self.model_size = data.get("model_size", DEFAULTS["model_size"])
-                self.device = data.get("device", DEFAULTS["device"])
-                self.compute_type = data.get("compute_type", DEFAULTS["compute_type"])
-                self.language = data.get("language", DEFAULTS["language"])
-                self.filter_background_noise = data.get("filter_background_noise", DEFAULTS["filter_background_noise"])
-            except (json.JSONDecodeError, KeyError):
-                pass
+        # Read directly and handle a missing file via the exception —
+        # avoids a separate exists() stat, and json.loads accepts bytes
+        try:
+            raw = _settings_file().read_bytes()
+        except FileNotFoundError:
+            return
+        try:
+            data = json.loads(raw)
+        except (json.JSONDecodeError, KeyError):
+            return
+        for key, default in DEFAULTS.items():
+            setattr(self, key, data.get(key, default))
+        self._last_saved = self.to_dict()
 
     def save(self):
-        """Persist settings to disk."""
-        data = {
-            "model_size": self.model_size,
-            "device": self.device,
-            "compute_type": self.compute_type,
-            "language": self.language,
-            "filter_background_noise": self.filter_background_noise,
-        }
-        SETTINGS_FILE.write_text(json.dumps(data, indent=2))
+        """Persist settings to disk atomically, skipping no-op saves."""
+        data = self.to_dict()
+        if data == self._last_saved:
+            return
+        settings_file = _settings_file()
+        # Write to a temp file and rename so a crash can't truncate settings.json
+        tmp = settings_file.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, settings_file)
+        self._last_saved = data
 
     def reset_to_defaults(self):
         """Reset all settings to defaults."""
-        self.model_size = DEFAULTS["model_size"]
-        self.device = DEFAULTS["device"]
-        self.compute_type = DEFAULTS["compute_type"]
-        self.language = DEFAULTS["language"]
-        self.filter_background_noise = DEFAULTS["filter_background_noise"]
+        for key, value in DEFAULTS.items():
+            setattr(self, key, value)
 
     def to_dict(self):
         """Return settings as a dictionary."""
-        return {
-            "model_size": self.model_size,
-            "device": self.device,
-            "compute_type": self.compute_type,
-            "language": self.language,
-            "filter_background_noise": self.filter_background_noise,
-        }
+        return {key: getattr(self, key) for key in DEFAULTS}
 
 
-def is_model_downloaded(model_size: str) -> bool:
-    """Check if a faster-whisper model is already downloaded."""
-    # Models are cached in ~/.cache/huggingface/hub/
-    cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-    if not cache_dir.exists():
-        return False
+# Whisper models are cached in ~/.cache/huggingface/hub/
+_HUB_DIR = Path.home() / ".cache" / "huggingface" / "hub"
 
-    # Model naming pattern: models--Systran--faster-whisper-{size}
-    model_name = f"models--Systran--faster-whisper-{model_size}"
-    model_path = cache_dir / model_name
 
-    # Check if the model directory exists and has content
-    if model_path.exists():
-        # Check for the snapshots directory which contains the actual model
-        snapshots = model_path / "snapshots"
-        if snapshots.exists() and any(snapshots.iterdir()):
-            return True
-
-    return False
+@functools.lru_cache(maxsize=None)
+def is_model_downloaded(model_size: str) -> bool:
+    """Check if a faster-whisper model is already downloaded.
+
+    Results are memoized for the session (five syscalls per call add up
+    when the Settings dialog rebuilds its combo). Call
+    ``is_model_downloaded.cache_clear()`` after triggering a download.
+    """
+    # Model naming pattern: models--Systran--faster-whisper-{size}.
+    # A non-empty snapshots dir means the model has been fetched; scandir
+    # the deepest path directly and let FileNotFoundError cover every
+    # missing ancestor, instead of stat-ing each level
+    snapshots = _HUB_DIR / f"models--Systran--faster-whisper-{model_size}" / "snapshots"
+    try:
+        with os.scandir(snapshots) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
 
 
+@functools.lru_cache(maxsize=None)
 def get_model_size_gb(model_size: str) -> float:
     """Get the approximate download size in GB for a model."""
     return MODEL_SIZES.get(model_size, 0.5)
@@ -1,8 +1,10 @@
-import sounddevice as sd
-import soundfile as sf
-import numpy as np
+# sounddevice (PortAudio via ctypes), soundfile and numpy are imported
+# lazily inside the functions that touch audio — callers that only need
+# availability/price checks skip their load cost entirely
+import functools
 import tempfile
 import os
+import threading
 import time
 import socket
 import json
@@ -27,6 +29,10 @@ if _data_env.exists():
 else:
     load_dotenv()
 
+# Matches a dollar figure following a mention of Whisper on the pricing page
+_PRICE_RE = re.compile(r"[Ww]hisper.{0,300}?\$(\d+\.\d+)", re.DOTALL)
+PRICING_URL = "https://openai.com/api/pricing/"
+
 DEFAULT_PRICE = 0.006
 PRICE_CACHE_FILE = _data_dir / "price_cache.json"
 PRICE_CHECK_INTERVAL_DAYS = 7
@@ -36,44 +42,127 @@ BLOCK_PRICE_PER_MINUTE = float(os.environ.get("BLOCK_PRICE_PER_MINUTE", 0.1))
 # Cached price — populated lazily on first API transcription
 _cached_api_price = None
 
+# Parsed price-cache contents, guarded by the file's mtime so the JSON
+# is only re-read and re-parsed when the file actually changes
+_price_cache_mem = None  # (mtime, dict)
+
+
+def _read_price_cache():
+    """Return the parsed price cache dict, or None if missing/corrupt."""
+    global _price_cache_mem
+    try:
+        mtime = PRICE_CACHE_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if _price_cache_mem is not None and _price_cache_mem[0] == mtime:
+        return _price_cache_mem[1]
+    try:
+        cache = json.loads(PRICE_CACHE_FILE.read_bytes())
+    except (json.JSONDecodeError, KeyError):
+        return None
+    _price_cache_mem = (mtime, cache)
+    return cache
+
+
+def _write_price_cache(cache):
+    """Atomically write the price cache."""
+    tmp = PRICE_CACHE_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(cache, indent=2))
+    os.replace(tmp, PRICE_CACHE_FILE)
+
 
 def _default_status(msg):
     print(msg)
 
 
+# Connectivity probe state: resolved API address (skips DNS on reprobes)
+# and the last result, cached for a short TTL so back-to-back
+# transcriptions don't each pay a network round trip
+_api_addr = None
+_net_check = (0.0, False)  # (monotonic timestamp, result)
+NET_CHECK_TTL = 5.0
+
+
 def has_internet():
-    """Quick check for internet connectivity."""
+    """Quick check for internet connectivity, cached for a few seconds."""
+    global _api_addr, _net_check
+    ts, result = _net_check
+    now = time.monotonic()
+    if now - ts < NET_CHECK_TTL:
+        return result
     try:
-        socket.create_connection(("api.openai.com", 443), timeout=2)
-        return True
+        if _api_addr is None:
+            info = socket.getaddrinfo("api.openai.com", 443,
+                                      proto=socket.IPPROTO_TCP)
+            _api_addr = info[0][4][:2]
+        # 0.5s is enough to tell offline from online without stalling the UI
+        socket.create_connection(_api_addr, timeout=0.5).close()
+        result = True
     except OSError:
-        return False
+        _api_addr = None  # DNS may have been the failure; re-resolve next time
+        result = False
+    _net_check = (now, result)
+    return result
 
 
-def check_api_available():
-    """Check if API mode is available. Returns (available, reason)."""
-    if not os.environ.get("OPENAI_API_KEY"):
+def _price_cache_mtime():
+    """mtime of the price cache file, or 0 if it doesn't exist."""
+    try:
+        return PRICE_CACHE_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _availability_state(key_present, online, cache_mtime):
+    """Memoized availability verdict. The arguments are the invalidation
+    key: the result expires when the API key appears/disappears, the
+    connectivity probe flips, or the price cache file is rewritten."""
+    if not key_present:
         return False, "No API key set"
-    if not has_internet():
+    if not online:
         return False, "No internet connection"
     # Check cached price (don't trigger a new lookup here)
-    if _cached_api_price is not None and _cached_api_price >= BLOCK_PRICE_PER_MINUTE:
-        return False, f"API price too high (${_cached_api_price:.3f}/min)"
-    # Also check file cache
-    if PRICE_CACHE_FILE.exists():
+    price = (_cached_api_price if _cached_api_price is not None
+             else _read_cached_price())
+    if price >= BLOCK_PRICE_PER_MINUTE:
+        return False, f"API price too high (${price:.3f}/min)"
+    return True, None
+
+
+def check_api_available():
+    """Check if API mode is available. Returns (available, reason)."""
+    return _availability_state(
+        bool(os.environ.get("OPENAI_API_KEY")),
+        has_internet(),
+        _price_cache_mtime(),
+    )
+
+
+def _read_cached_price():
+    """Price from the file cache (or the default), without any network."""
+    cache = _read_price_cache()
+    if cache:
+        return cache.get("price_per_minute", DEFAULT_PRICE)
+    return DEFAULT_PRICE
+
+
+def _price_cache_stale():
+    """True if the weekly price check is due."""
+    cache = _read_price_cache()
+    if cache:
         try:
-            cache = json.loads(PRICE_CACHE_FILE.read_text())
-            price = cache.get("price_per_minute", DEFAULT_PRICE)
-            if price >= BLOCK_PRICE_PER_MINUTE:
-                return False, f"API price too high (${price:.3f}/min)"
-        except (json.JSONDecodeError, KeyError):
+            last_checked = datetime.fromisoformat(cache["last_checked"])
+            return (datetime.now() - last_checked
+                    >= timedelta(days=PRICE_CHECK_INTERVAL_DAYS))
+        except (KeyError, ValueError):
             pass
-    return True, None
+    return True
 
 
 def get_api_price(status=None):
-    """Get the Whisper API price, checking via LLM if cache is stale.
-    Returns the price and caches it for the session."""
+    """Get the Whisper API price, scraping the pricing page if the cache
+    is stale. Returns the price and caches it for the session."""
     global _cached_api_price
     if status is None:
         status = _default_status
@@ -82,12 +171,7 @@ def get_api_price(status=None):
         return _cached_api_price
 
     # Read existing cache
-    cache = None
-    if PRICE_CACHE_FILE.exists():
-        try:
-            cache = json.loads(PRICE_CACHE_FILE.read_text())
-        except (json.JSONDecodeError, KeyError):
-            cache = None
+    cache = _read_price_cache()
 
     # Check if we need to refresh
     needs_refresh = True
@@ -100,29 +184,19 @@ def get_api_price(status=None):
         _cached_api_price = cache["price_per_minute"]
         return _cached_api_price
 
-    # Try to look up the current price via LLM
+    # Scrape the current price from the public pricing page — a plain
+    # GET + regex, no API key or LLM call needed
     cached_price = cache["price_per_minute"] if cache else DEFAULT_PRICE
-    if not os.environ.get("OPENAI_API_KEY") or not has_internet():
+    if not has_internet():
         _cached_api_price = cached_price
         return _cached_api_price
 
     status("Checking API price (hasn't been checked in a week)...")
     try:
-        from openai import OpenAI
-        client = OpenAI(timeout=10.0)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{
-                "role": "user",
-                "content": (
-                    "What is the current OpenAI Whisper API (whisper-1) price "
-                    "per minute of audio in USD? Reply with ONLY the numeric "
-                    "value, e.g. 0.006"
-                ),
-            }],
-        )
-        text = response.choices[0].message.content.strip()
-        match = re.search(r"(\d+\.?\d*)", text)
+        import httpx  # Already installed as an openai dependency
+        response = httpx.get(PRICING_URL, timeout=5.0, follow_redirects=True)
+        response.raise_for_status()
+        match = _PRICE_RE.search(response.text)
         if match:
             new_price = float(match.group(1))
             if 0.0001 <= new_price <= 1.0:
@@ -130,13 +204,13 @@ def get_api_price(status=None):
                     "price_per_minute": new_price,
                     "last_checked": datetime.now().isoformat(),
                 }
-                PRICE_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+                _write_price_cache(cache)
                 status(f"API price updated: ${new_price}/min")
                 _cached_api_price = new_price
                 return _cached_api_price
 
-        status(f"Could not parse price from LLM. Using ${cached_price}/min")
-    except Exception as e:
+        status(f"Could not find price on pricing page. Using ${cached_price}/min")
+    except Exception:
         status(f"Price check failed. Using ${cached_price}/min")
 
     # If lookup failed, update timestamp so we don't retry every launch
@@ -144,109 +218,343 @@ def get_api_price(status=None):
         "price_per_minute": cached_price,
         "last_checked": datetime.now().isoformat(),
     }
-    PRICE_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+    _write_price_cache(cache)
     _cached_api_price = cached_price
     return _cached_api_price
 
 
+def refresh_api_price_async():
+    """Run the weekly price refresh on a daemon thread if it's due.
+
+    Keeps the (up to 10s) LLM lookup off the transcription path:
+    transcribe_audio only ever reads the cached price.
+    """
+    if os.environ.get("OPENAI_API_KEY") and _price_cache_stale():
+        threading.Thread(target=get_api_price, daemon=True).start()
+
+
+# Kick off the refresh as soon as the module loads (itself deferred to
+# first recording), so the cache is warm by the time a price is needed
+refresh_api_price_async()
+
+
 class Recorder:
-    """Non-blocking audio recorder that can be started/stopped on demand."""
+    """Non-blocking audio recorder that can be started/stopped on demand.
+
+    Audio is streamed straight into a temp WAV as it arrives, so no
+    in-memory copy of the recording is ever held.
+    """
 
     def __init__(self, sample_rate=16000):
         self.sample_rate = sample_rate
-        self.frames = []
         self.recording = False
         self.stream = None
-        self.start_time = None
+        self._sf = None
+        self._temp_path = None
+        self._samples = 0
 
     def _callback(self, indata, frames, time_info, status):
         if self.recording:
-            self.frames.append(indata.copy())
+            # The write is the only per-block work — no Python-side
+            # accumulation, so nothing is concatenated at stop time.
+            # buffer_write skips sf.write's dtype inference and hands the
+            # int16 block straight to libsndfile's short writer
+            self._sf.buffer_write(indata, dtype='int16')
+            self._samples += len(indata)
 
     def start(self):
-        self.frames = []
+        import sounddevice as sd
+        import soundfile as sf
+
+        temp_fd, self._temp_path = tempfile.mkstemp(suffix='.wav')
+        os.close(temp_fd)
+        # PCM_16 halves the bytes on disk vs float32, which is all
+        # Whisper needs anyway
+        self._sf = sf.SoundFile(
+            self._temp_path, mode='w', samplerate=self.sample_rate,
+            channels=1, subtype='PCM_16',
+        )
+        self._samples = 0
         self.recording = True
-        self.start_time = time.time()
+        # Capture int16 directly — 2 bytes/sample end to end, and exactly
+        # what the PCM_16 WAV stores, so no dtype conversion anywhere
         self.stream = sd.InputStream(
             samplerate=self.sample_rate, channels=1,
-            dtype='float32', callback=self._callback,
+            dtype='int16', callback=self._callback,
         )
         self.stream.start()
 
     def stop(self):
         self.recording = False
-        duration = time.time() - self.start_time
         if self.stream:
             self.stream.stop()
             self.stream.close()
             self.stream = None
-        return duration
+        if self._sf:
+            self._sf.close()
+            self._sf = None
+        # Samples written / rate is the true audio duration; wall-clock
+        # time includes stream startup latency and scheduling jitter
+        return self._samples / self.sample_rate
 
     def save_to_temp(self):
-        """Save recorded audio to a temp file. Caller must delete it."""
-        data = np.concatenate(self.frames)
-        temp_fd, temp_path = tempfile.mkstemp(suffix='.wav')
-        os.close(temp_fd)
-        sf.write(temp_path, data, self.sample_rate)
-        return temp_path
+        """Return the temp WAV streamed during capture. Caller must delete it.
+
+        The SoundFile opened in start() is the single WAV-write site: the
+        file is written incrementally as PCM_16 with no close/reopen or
+        re-slicing at stop time.
+        """
+        return self._temp_path
 
 
 def transcribe_with_api(audio_path):
     """Transcribe using OpenAI Whisper API."""
     from openai import OpenAI
-    client = OpenAI(timeout=5.0)
+    # Scale the timeout with file size (assume at least 200 KB/s upstream)
+    # so long recordings on slow links aren't doomed to time out; a flat
+    # 5s made the API path fail for anything but short clips. Retries
+    # cover transient 5xx/connection errors.
+    audio_bytes = os.path.getsize(audio_path)
+    timeout = max(10.0, audio_bytes / 200_000)
+    client = OpenAI(timeout=timeout, max_retries=2)
     with open(audio_path, "rb") as f:
-        result = client.audio.transcriptions.create(model="whisper-1", file=f)
+        # The (name, file, content-type) tuple makes the SDK stream the
+        # multipart body instead of buffering the whole WAV in memory
+        result = client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(os.path.basename(audio_path), f, "audio/wav"),
+        )
     return result.text
 
 
 # Cache for the local whisper model (avoid reloading on each transcription)
 _cached_local_model = None
 _cached_model_params = None
+_model_lock = threading.Lock()
 
+# Params of the in-flight or completed warmup; prewarm_model is a no-op
+# when they match, so repeat calls don't queue dummy decodes ahead of
+# real transcriptions
+_warmed_params = None
 
-def transcribe_locally(audio_path, model_size="small", device="cpu",
-                       compute_type="int8", language="en",
-                       filter_background_noise=True):
-    """Fallback: transcribe locally using faster-whisper."""
+
+# Resolved once per process; see _resolve_compute_type
+_resolved_int8_type = None
+
+
+def _resolve_compute_type(compute_type):
+    """Upgrade plain "int8" to an int8 variant with fp16/bf16 activations
+    when the CPU supports one (AVX-512-VNNI / AMX). Weights stay int8, so
+    there is no accuracy cost, but activations hit the fast GEMM path."""
+    global _resolved_int8_type
+    if compute_type != "int8":
+        return compute_type
+    if _resolved_int8_type is None:
+        try:
+            import ctranslate2
+            supported = ctranslate2.get_supported_compute_types("cpu")
+        except Exception:
+            supported = ()
+        if "int8_bfloat16" in supported:
+            _resolved_int8_type = "int8_bfloat16"
+        elif "int8_float16" in supported:
+            _resolved_int8_type = "int8_float16"
+        else:
+            _resolved_int8_type = "int8"
+    return _resolved_int8_type
+
+
+# CTranslate2 inference workers; the chunked long-recording path fans
+# out one decode per worker
+MODEL_WORKERS = 2
+
+
+def _model_workers():
+    """Worker count for the model, bounded by the physical core count."""
+    return min(MODEL_WORKERS, max(1, (os.cpu_count() or 2) // 2))
+
+
+def _load_model(model_size, device, compute_type):
+    """Return the cached WhisperModel, loading it under a lock if needed."""
     global _cached_local_model, _cached_model_params
 
     from faster_whisper import WhisperModel
 
-    # Check if we need to reload the model (settings changed)
+    # Both prewarm and transcribe resolve the same way, so the cached
+    # params always match and the upgrade never forces a reload
+    compute_type = _resolve_compute_type(compute_type)
     current_params = (model_size, device, compute_type)
-    if _cached_local_model is None or _cached_model_params != current_params:
-        _cached_local_model = WhisperModel(model_size, device=device,
-                                           compute_type=compute_type)
-        _cached_model_params = current_params
+    with _model_lock:
+        if _cached_local_model is None or _cached_model_params != current_params:
+            # Pin CTranslate2 to roughly the physical core count —
+            # the default oversubscribes SMT siblings (and efficiency
+            # cores on Apple Silicon), thrashing context switches.
+            # Each worker gets the full budget: a short decode occupies
+            # one worker and must not run on a fraction of the cores,
+            # and the chunked path's worst case (workers x physical)
+            # is bounded by the logical core count on rare long files
+            cpu_threads = max(1, (os.cpu_count() or 2) // 2)
+            _cached_local_model = WhisperModel(model_size, device=device,
+                                               compute_type=compute_type,
+                                               cpu_threads=cpu_threads,
+                                               num_workers=_model_workers())
+            _cached_model_params = current_params
+        return _cached_local_model
+
+
+def prewarm_model(model_size="small", device="cpu", compute_type="int8"):
+    """Load the local model (and JIT its kernels) in a background thread.
+
+    Called when recording starts: the mic time is idle CPU, so a cold
+    model load that would otherwise serialize after the user stops
+    speaking happens for free. Best-effort — any error is left for the
+    real transcription to surface.
+    """
+    # Resolve the same way _load_model does, so a match means the cached
+    # model really is the one that was warmed
+    global _warmed_params
+    params = (model_size, device, _resolve_compute_type(compute_type))
+    if params == _warmed_params:
+        return
+    # Claim the params before spawning so a second call while the warm
+    # is still in flight doesn't queue another silence decode; a failed
+    # warm releases the claim so the next call can retry
+    _warmed_params = params
+
+    def _warm():
+        global _warmed_params
+        import numpy as np
+        try:
+            model = _load_model(model_size, device, compute_type)
+            # Decode a second of silence to trigger kernel compilation
+            segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32))
+            for _ in segments:
+                pass
+        except Exception:
+            if _warmed_params == params:
+                _warmed_params = None
+
+    threading.Thread(target=_warm, daemon=True).start()
+
+
+# Parallel transcription kicks in above this duration; shorter files
+# don't amortize the VAD prepass and chunk scheduling
+PARALLEL_MIN_SECONDS = 60
+PARALLEL_CHUNK_SECONDS = 30
+WHISPER_SAMPLE_RATE = 16000
+
+
+def _audio_seconds(audio):
+    """Duration of a path-or-ndarray audio input, or None if unknown."""
+    import numpy as np
+    import soundfile as sf
+
+    if isinstance(audio, np.ndarray):
+        return len(audio) / WHISPER_SAMPLE_RATE
+    try:
+        return sf.info(audio).duration
+    except RuntimeError:
+        return None
+
+
+def _transcribe_chunked(model, samples, lang):
+    """Transcribe a long recording by splitting at VAD silence boundaries
+    and decoding the chunks in parallel.
+
+    CTranslate2 releases the GIL during inference and the model is
+    built with one inference worker per pool thread (see _load_model),
+    so the decodes genuinely run concurrently rather than queueing on
+    a single worker. Chunk results are joined in timestamp order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    speech = get_speech_timestamps(
+        samples, VadOptions(min_silence_duration_ms=500))
+    if not speech:
+        return ""
+
+    # Merge speech regions into chunks of at most PARALLEL_CHUNK_SECONDS,
+    # splitting only at silences so no words are cut mid-utterance
+    max_samples = PARALLEL_CHUNK_SECONDS * WHISPER_SAMPLE_RATE
+    chunks = []
+    start, end = speech[0]["start"], speech[0]["end"]
+    for region in speech[1:]:
+        if region["end"] - start > max_samples:
+            chunks.append((start, end))
+            start = region["start"]
+        end = region["end"]
+    chunks.append((start, end))
+
+    def decode(chunk):
+        s, e = chunk
+        segments, _ = model.transcribe(samples[s:e], language=lang)
+        return "".join(segment.text for segment in segments)
+
+    with ThreadPoolExecutor(max_workers=_model_workers()) as pool:
+        return "".join(pool.map(decode, chunks))
+
+
+def transcribe_locally(audio, model_size="small", device="cpu",
+                       compute_type="int8", language="en",
+                       filter_background_noise=True):
+    """Fallback: transcribe locally using faster-whisper.
+
+    ``audio`` may be a file path or a 16 kHz mono float32 ndarray.
+    Passing the array skips faster-whisper's file decode entirely, for
+    callers that already hold the samples in memory.
+    """
+    import numpy as np
+
+    # Reuses a prewarmed model when the params match; reloads otherwise
+    model = _load_model(model_size, device, compute_type)
 
     # language=None means auto-detect
     lang = None if language == "auto" else language
 
+    # Long recordings: split at VAD silences and decode in parallel
+    # (the chunked path applies the noise filter via its VAD prepass)
+    if filter_background_noise:
+        duration = _audio_seconds(audio)
+        if duration is not None and duration > PARALLEL_MIN_SECONDS:
+            if isinstance(audio, np.ndarray):
+                samples = audio
+            else:
+                from faster_whisper.audio import decode_audio
+                samples = decode_audio(audio, sampling_rate=WHISPER_SAMPLE_RATE)
+            return _transcribe_chunked(model, samples, lang)
+
     # VAD filter removes non-speech segments (background noise, typing, etc.)
     if filter_background_noise:
-        segments, _ = _cached_local_model.transcribe(
-            audio_path,
+        segments, _ = model.transcribe(
+            audio,
             language=lang,
             vad_filter=True,
             vad_parameters=dict(min_silence_duration_ms=500),
         )
     else:
-        segments, _ = _cached_local_model.transcribe(audio_path, language=lang)
+        segments, _ = model.transcribe(audio, language=lang)
 
     return "".join(segment.text for segment in segments)
 
 
+def is_model_cached():
+    """True if a local model has been instantiated this session."""
+    return _cached_local_model is not None
+
+
 def clear_cached_model():
     """Clear the cached local model (call when settings change)."""
-    global _cached_local_model, _cached_model_params
+    global _cached_local_model, _cached_model_params, _warmed_params
     _cached_local_model = None
     _cached_model_params = None
+    _warmed_params = None
 
 
 def transcribe_audio(audio_path, force_local=False, status=None,
                      model_size="small", device="cpu", compute_type="int8",
-                     language="en", filter_background_noise=True):
+                     language="en", filter_background_noise=True,
+                     speculative_warmup=True):
     """Transcribe audio, preferring API with local fallback.
 
     Args:
@@ -258,6 +566,8 @@ def transcribe_audio(audio_path, force_local=False, status=None,
         compute_type: Compute type for local model (int8, float16, float32)
         language: Language code or "auto" for auto-detection
         filter_background_noise: If True, filter out non-speech sounds
+        speculative_warmup: If True, load the local model in the
+            background while the API call runs, so a fallback is instant
     """
     if status is None:
         status = _default_status
@@ -278,10 +588,12 @@ def transcribe_audio(audio_path, force_local=False, status=None,
         reason = "No internet connection"
         use_api = False
 
-    # Lazy price check — only when using API
+    # Price check — cached values only; the background refresh
+    # (refresh_api_price_async) keeps them current, so this never blocks
     api_price = None
     if use_api:
-        api_price = get_api_price(status=status)
+        api_price = (_cached_api_price if _cached_api_price is not None
+                     else _read_cached_price())
         if api_price >= BLOCK_PRICE_PER_MINUTE:
             reason = f"API price (${api_price:.3f}/min) exceeds ${BLOCK_PRICE_PER_MINUTE:.2f}/min"
             use_api = False
@@ -293,6 +605,11 @@ def transcribe_audio(audio_path, force_local=False, status=None,
     used_api = False
     if use_api:
         status("Transcribing via API...")
+        # Warm the local model while the upload runs: if the API fails
+        # (flaky wifi, timeout), the fallback doesn't pay the upload
+        # timeout plus a cold model load back to back
+        if speculative_warmup:
+            prewarm_model(model_size, device, compute_type)
         try:
             text = transcribe_with_api(audio_path)
             used_api = True